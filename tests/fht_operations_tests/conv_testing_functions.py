@@ -1,7 +1,6 @@
-"""Contains useful functions for testing convolution-based operations.
-We test generally by comparing to the simplest and most idiot-proof
-(i.e. verbose and slow) way of doing the operation in question
-to the output from the wrapped C / Cuda modules."""
+"""Contains useful functions for testing convolution-based operations,
+by comparing a NumPy reference implementation with the output from
+the wrapped C / Cuda modules."""
 from math import ceil
 
 import numpy as np
@@ -41,35 +40,49 @@ def get_initial_matrices_fht(ndatapoints, kernel_width, aa_dim, num_aas,
 
 
 
-def get_reshaped_x(xdata, kernel_width, dim2, radem, num_blocks,
-                    repeat_num, precision = "double"):
-    """This is the slow / simple / stupid way to generate the results of
-    FHT-based convolution, for comparison with the output from the wrapped
-    CPU / Cuda modules. The latter will be faster, but by using this
-    straightforward approach we can ensure the former is correct."""
-
+def get_scaled_radem(radem, dim2):
+    """Folds the Hadamard normalization constant into the diagonal
+    matrices, so that this is done once per set of features rather
+    than on every call to get_reshaped_x. Returns a (3, M) array
+    for (3, 1, M) input."""
     norm_constant = np.log2(dim2) / 2
     norm_constant = 1 / (2**norm_constant)
+    return radem[:,0,:] * norm_constant
+
 
-    reshaped_x = np.zeros((xdata.shape[0], num_blocks, dim2))
+
+def get_reshaped_x(xdata, kernel_width, dim2, scaled_radem, num_blocks,
+                    repeat_num, precision = "double"):
+    """Generates the results of FHT-based convolution for one repeat
+    for all kmers of all datapoints at once, for comparison with the
+    output from the wrapped CPU / Cuda modules. scaled_radem is the
+    output of get_scaled_radem (the diagonals with the Hadamard
+    normalization already applied). Returns a new
+    (N, num_blocks, dim2) array that callers may modify in place."""
+    dtype = np.float32 if precision == "float" else np.float64
+    reshaped_x = np.empty((xdata.shape[0], num_blocks, dim2), dtype=dtype)
     fht_func = cFHT
-    if precision == "float":
-        reshaped_x = reshaped_x.astype(np.float32)
 
+    # Only the padding past the end of each window needs to be zeroed,
+    # since everything before it is overwritten by the windowed input.
     window_size = xdata.shape[2] * kernel_width
+    reshaped_x[:,:,window_size:] = 0
     start = repeat_num * reshaped_x.shape[2]
     end = start + reshaped_x.shape[2]
 
-    for i in range(xdata.shape[1] - kernel_width + 1):
-        window = xdata[:,i:i+kernel_width,:]
-        reshaped_x[:,i,:window_size] = window.reshape((window.shape[0],
-                        window.shape[1] * window.shape[2]))
-    reshaped_x *= radem[0:1,:,start:end] * norm_constant
-    fht_func(reshaped_x, 1)
-    reshaped_x *= radem[1:2,:,start:end] * norm_constant
-    fht_func(reshaped_x, 1)
-    reshaped_x *= radem[2:3,:,start:end] * norm_constant
-    fht_func(reshaped_x, 1)
+    # sliding_window_view puts the window axis last, so swap it with the
+    # feature axis to match the layout of a flattened (kernel_width, D) window.
+    windows = np.lib.stride_tricks.sliding_window_view(xdata, kernel_width, axis=1)
+    # Reshaping the destination (rather than the transposed windows) gives
+    # a view, so the input is copied into reshaped_x only once.
+    np.copyto(reshaped_x[:,:,:window_size].reshape(xdata.shape[0], num_blocks,
+                kernel_width, xdata.shape[2]), windows.transpose(0,1,3,2),
+                casting="same_kind")
+    # Each diagonal is a contiguous 1d row, so that it broadcasts
+    # over the datapoint and kmer axes.
+    for k in range(3):
+        reshaped_x *= scaled_radem[k,start:end]
+        fht_func(reshaped_x, 1)
 
     return reshaped_x
 
@@ -78,72 +91,105 @@ def get_features(xdata, kernel_width, dim2,
             radem, s_mat, num_freqs, num_blocks, sigma,
             sequence_lengths, precision = "double",
             normalization = 0):
-    """Builds the ground truth features using an inefficient
-    but easy to troubleshoot approach, for comparison with
-    the features generated by the extensions."""
+    """Builds the ground truth features for comparison with
+    the features generated by the extensions. Kmers past the end
+    of each sequence are masked out, and the sqrt(1 / num_freqs)
+    and sequence-length normalizations are folded into a
+    per-sequence scaling vector applied to the masked sums."""
     num_repeats = ceil(num_freqs / dim2)
+    scaled_radem = get_scaled_radem(radem, dim2)
     counter = 0
-    features = np.zeros((xdata.shape[0], 2 * num_freqs))
+    dtype = np.float32 if precision == "float" else np.float64
+    features = np.zeros((xdata.shape[0], 2 * num_freqs), dtype=dtype)
+
+    # Zero out the contribution of kmers that extend into the zero padding
+    # past the end of each sequence.
+    cutpoints = sequence_lengths - kernel_width + 1
+    mask = (np.arange(num_blocks)[None,:] < cutpoints[:,None]).astype(xdata.dtype)
+    # The sqrt(1 / num_freqs) normalization applies to the sums rather than
+    # to the cos / sin arguments, so it is folded into the per-sequence scaling.
+    scaling_vec = np.full(xdata.shape[0], np.sqrt(1 / float(num_freqs)), dtype=dtype)
+    if normalization == 1:
+        scaling_vec /= np.sqrt(cutpoints)
+    elif normalization == 2:
+        scaling_vec /= cutpoints
 
     for i in range(num_repeats):
-        reshaped_x = get_reshaped_x(xdata, kernel_width, dim2, radem,
+        reshaped_x = get_reshaped_x(xdata, kernel_width, dim2, scaled_radem,
                                 num_blocks, i, precision)
 
         end_position = min((i + 1) * dim2, num_freqs)
         end_position -= i * dim2
         counter = i * dim2
 
-        for j in range(end_position):
-            temp = reshaped_x[:,:,j] * s_mat[counter] * sigma
-
-            for k in range(features.shape[0]):
-                cutpoint = sequence_lengths[k] - kernel_width + 1
-                scaling_factor = 1
-                if normalization == 1:
-                    scaling_factor /= np.sqrt(cutpoint)
-                elif normalization == 2:
-                    scaling_factor /= cutpoint
-                features[k:k+1, 2 * counter] = np.cos(temp[k:k+1,:cutpoint]).sum() * scaling_factor
-                features[k:k+1, 2 * counter + 1] = np.sin(temp[k:k+1,:cutpoint]).sum() * scaling_factor
-            counter += 1
-
-    features *= np.sqrt(1 / float(num_freqs))
+        scale = (s_mat[counter:counter + end_position] * sigma).astype(reshaped_x.dtype)
+        temp = reshaped_x[:,:,:end_position] * scale
+        cos_sum = np.einsum("ij,ijk->ik", mask, np.cos(temp))
+        sin_sum = np.einsum("ij,ijk->ik", mask, np.sin(temp))
+        features[:, 2 * counter:2 * (counter + end_position):2] = \
+                cos_sum * scaling_vec[:,None]
+        features[:, 2 * counter + 1:2 * (counter + end_position):2] = \
+                sin_sum * scaling_vec[:,None]
+
     return features
 
 
 def get_features_with_gradient(xdata, kernel_width, dim2,
             radem, s_mat, num_freqs, num_blocks, sigma,
             sequence_lengths, precision = "double"):
-    """Builds the ground truth features and gradient using an inefficient
-    but easy to troubleshoot approach, for comparison with
-    the features generated by the extensions."""
+    """Builds the ground truth features and gradient for comparison
+    with those generated by the extensions. To limit memory use,
+    each repeat scales reshaped_x in place and reuses one buffer for
+    cos, sin and their products. The sqrt(1 / num_freqs) normalization
+    is folded into the kmer mask."""
     num_repeats = ceil(num_freqs / dim2)
+    scaled_radem = get_scaled_radem(radem, dim2)
     counter = 0
-    features = np.zeros((xdata.shape[0], 2 * num_freqs))
-    gradient = np.zeros(features.shape)
+    dtype = np.float32 if precision == "float" else np.float64
+    features = np.zeros((xdata.shape[0], 2 * num_freqs), dtype=dtype)
+    gradient = np.zeros(features.shape, dtype=dtype)
+
+    cutpoints = sequence_lengths - kernel_width + 1
+    mask = (np.arange(num_blocks)[None,:] < cutpoints[:,None]).astype(xdata.dtype)
+    # Fold the sqrt(1 / num_freqs) normalization into the mask used to
+    # sum over kmers.
+    feature_mask = mask * np.sqrt(1 / num_freqs)
+    # A single buffer is reused for cos, sin and their products with
+    # the scaled input so that peak memory stays at about twice reshaped_x.
+    trig_buffer = np.empty((xdata.shape[0], num_blocks, dim2), dtype=dtype)
 
     for i in range(num_repeats):
-        reshaped_x = get_reshaped_x(xdata, kernel_width, dim2, radem,
+        reshaped_x = get_reshaped_x(xdata, kernel_width, dim2, scaled_radem,
                                 num_blocks, i, precision)
         end_position = min((i + 1) * dim2, num_freqs)
         end_position -= i * dim2
         counter = i * dim2
-        for j in range(end_position):
-            reshaped_x[:,:,j] *= s_mat[counter]
-            temp_arr = reshaped_x[:,:,j] * sigma
-            for k in range(features.shape[0]):
-                cutpoint = sequence_lengths[k] - kernel_width + 1
-                gradient[k:k+1,2 * counter] = np.sum(-np.sin(temp_arr[k:k+1,:cutpoint]) *
-                    reshaped_x[k:k+1,:cutpoint,j], axis = 1)
-                features[k:k+1,2 * counter] = np.sum(np.cos(temp_arr[k:k+1,:cutpoint]), axis = 1)
-
-                gradient[k:k+1,2 * counter + 1] = np.sum(np.cos(temp_arr[k:k+1,:cutpoint]) *
-                    reshaped_x[k:k+1,:cutpoint,j], axis = 1)
-                features[k:k+1,2 * counter + 1] = np.sum(np.sin(temp_arr[k:k+1,:cutpoint]), axis = 1)
-            counter += 1
-
-    gradient *= np.sqrt(1 / num_freqs)
-    features *= np.sqrt(1 / num_freqs)
+
+        # The derivative of cos(sigma * s * x) w/r/t sigma is
+        # -sin(sigma * s * x) * s * x, so reshaped_x is scaled in place
+        # to s * x and multiplied by sigma only when taking cos / sin.
+        s_vals = s_mat[counter:counter + end_position].astype(reshaped_x.dtype)
+        sx_arr = reshaped_x[:,:,:end_position]
+        sx_arr *= s_vals
+        trig_arr = trig_buffer[:,:,:end_position]
+
+        np.multiply(sx_arr, sigma, out=trig_arr)
+        np.cos(trig_arr, out=trig_arr)
+        features[:, 2 * counter:2 * (counter + end_position):2] = \
+                np.einsum("ij,ijk->ik", feature_mask, trig_arr)
+        trig_arr *= sx_arr
+        gradient[:, 2 * counter + 1:2 * (counter + end_position):2] = \
+                np.einsum("ij,ijk->ik", feature_mask, trig_arr)
+
+        np.multiply(sx_arr, sigma, out=trig_arr)
+        np.sin(trig_arr, out=trig_arr)
+        features[:, 2 * counter + 1:2 * (counter + end_position):2] = \
+                np.einsum("ij,ijk->ik", feature_mask, trig_arr)
+        trig_arr *= sx_arr
+        gradient[:, 2 * counter:2 * (counter + end_position):2] = \
+                -np.einsum("ij,ijk->ik", feature_mask, trig_arr)
+        del reshaped_x, sx_arr
+
     return features, gradient
 
 
@@ -151,19 +197,21 @@ def get_features_with_gradient(xdata, kernel_width, dim2,
 def get_features_maxpool(xdata, kernel_width, dim2,
             radem, s_mat, num_rffs, num_blocks,
             sequence_lengths, precision = "double"):
-    """Builds the ground truth features for maxpooling using an inefficient
-    but easy to troubleshoot approach, for comparison with
-    the features generated by the extensions."""
+    """Builds the ground truth features for maxpooling for comparison
+    with the features generated by the extensions. Kmers past the end
+    of each sequence are set to -inf before taking the max."""
     num_repeats = ceil(num_rffs / dim2)
+    scaled_radem = get_scaled_radem(radem, dim2)
     features = np.zeros((xdata.shape[0], num_rffs))
-    
+
+    cutpoints = sequence_lengths - kernel_width + 1
+    mask = np.arange(num_blocks)[None,:] < cutpoints[:,None]
+
     for i in range(num_repeats):
-        reshaped_x = get_reshaped_x(xdata, kernel_width, dim2, radem,
+        reshaped_x = get_reshaped_x(xdata, kernel_width, dim2, scaled_radem,
                                 num_blocks, i)
         start, end = i * dim2, min((i + 1) * dim2, num_rffs)
         reshaped_x = s_mat[None, None, start:end] * reshaped_x[...,:(end-start)]
-
-        for k in range(features.shape[0]):
-            cutpoint = sequence_lengths[k] - kernel_width + 1
-            features[k:k+1, start:end] = reshaped_x[k:k+1,:cutpoint,:].max(axis=1).clip(min=0)
+        reshaped_x = np.where(mask[:,:,None], reshaped_x, -np.inf)
+        features[:, start:end] = reshaped_x.max(axis=1).clip(min=0)
     return features[:,:num_rffs]
@@ -1,7 +1,7 @@
 """Checks the fast Hadamard transform based convolution
 feature generation routines to ensure they are producing
-correct results by comparing with a clunky, simple
-mostly Python implementation."""
+correct results by comparing with a NumPy reference
+implementation."""
 import sys
 
 import unittest
@@ -122,9 +122,8 @@ def run_basic_eval(ndatapoints, kernel_width, aa_dim, num_aas,
     true_features = get_features(xdata, kernel_width, dim2,
                             radem, s_mat, num_freqs, num_blocks, sigma,
                             seqlen, precision, normalization)
-    xd = xdata * sigma
-    cpuConv1dFGen(xd, features, radem, s_mat,
-            seqlen, kernel_width, normalization, 2)
+    cpuConv1dFGen(xdata, features, radem, s_mat,
+            seqlen, sigma, kernel_width, normalization, 2)
 
     outcome = check_results(true_features, features, precision)
     if normalization != 0:
@@ -136,13 +135,13 @@ def run_basic_eval(ndatapoints, kernel_width, aa_dim, num_aas,
 
     if "cupy" not in sys.modules:
         return [outcome]
-    xd = cp.asarray(xd)
+    xd = cp.asarray(xdata)
     features[:] = 0
     features = cp.asarray(features)
     s_mat = cp.asarray(s_mat)
     radem = cp.asarray(radem)
     cudaConv1dFGen(xd, features, radem, s_mat,
-            seqlen, kernel_width, normalization)
+            seqlen, sigma, kernel_width, normalization)
 
     features = cp.asnumpy(features)
     outcome_cuda = check_results(true_features, features, precision)
@@ -4,7 +4,6 @@ Accepts only fixed vectors as input."""
 from math import ceil
 
 import numpy as np
-from scipy.stats import chi
 
 from xGPR.xgpr_cpu_rfgen_cpp_ext import cpuFastHadamardTransform2D as dFHT2d
 from xGPR.xgpr_cpu_rfgen_cpp_ext import cpuRBFFeatureGen, cpuMiniARDGrad
@@ -13,7 +12,7 @@ try:
     from xGPR.xgpr_cuda_rfgen_cpp_ext import cudaRBFFeatureGen, cudaMiniARDGrad
 except:
     pass
-from ..kernel_baseclass import KernelBaseclass
+from ..kernel_baseclass import KernelBaseclass, sample_chi
 
 
 class MiniARD(KernelBaseclass):
@@ -99,8 +98,7 @@ class MiniARD(KernelBaseclass):
             self.nblocks = 1
         self.radem_diag = rng.choice(radem_array, size=(3, 1, self.nblocks * self.padded_dims),
                                 replace=True)
-        self.chi_arr = chi.rvs(df=self.padded_dims, size=self.num_freqs,
-                            random_state = random_seed)
+        self.chi_arr = sample_chi(rng, self.padded_dims, self.num_freqs)
 
 
         #Converts the hyperparameters into a "full" array of the
@@ -157,7 +155,6 @@ class MiniARD(KernelBaseclass):
                 self.full_ard_weights = cp.asnumpy(self.full_ard_weights)
                 self.chi_arr = cp.asnumpy(self.chi_arr)
                 self.ard_position_key = cp.asnumpy(self.ard_position_key)
-                self.chi_arr = cp.asnumpy(self.chi_arr)
         else:
             self.radem_diag = cp.asarray(self.radem_diag)
             self.chi_arr = cp.asarray(self.chi_arr)
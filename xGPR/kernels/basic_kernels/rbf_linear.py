@@ -5,7 +5,6 @@ from abc import ABC
 from math import ceil
 
 import numpy as np
-from scipy.stats import chi
 
 from xGPR.xgpr_cpu_rfgen_cpp_ext import cpuRBFFeatureGen, cpuRBFGrad
 try:
@@ -13,7 +12,7 @@ try:
     from xGPR.xgpr_cuda_rfgen_cpp_ext import cudaRBFFeatureGen, cudaRBFGrad
 except:
     pass
-from ..kernel_baseclass import KernelBaseclass
+from ..kernel_baseclass import KernelBaseclass, sample_chi
 
 
 
@@ -119,8 +118,7 @@ class RBFLinear(KernelBaseclass, ABC):
             self.nblocks = 1
         self.radem_diag = rng.choice(radem_array, size=(3, 1,
                 self.nblocks * self.padded_dims), replace=True)
-        self.chi_arr = chi.rvs(df=self.padded_dims, size=self.num_freqs,
-                            random_state = random_seed)
+        self.chi_arr = sample_chi(rng, self.padded_dims, self.num_freqs)
 
         if not self.double_precision:
             self.chi_arr = self.chi_arr.astype(np.float32)
@@ -7,7 +7,6 @@ from abc import ABC
 from math import ceil
 
 import numpy as np
-from scipy.stats import chi
 
 from xGPR.xgpr_cpu_rfgen_cpp_ext import cpuRBFFeatureGen, cpuRBFGrad
 try:
@@ -16,7 +15,7 @@ try:
 except:
     pass
 
-from ..kernel_baseclass import KernelBaseclass
+from ..kernel_baseclass import KernelBaseclass, sample_chi
 
 
 
@@ -81,8 +80,7 @@ class SORFKernelBaseclass(KernelBaseclass, ABC):
             nblocks = 1
         self.radem_diag = rng.choice(radem_array, size=(3, 1,
                 nblocks * padded_dims), replace=True)
-        self.chi_arr = chi.rvs(df=padded_dims, size=self.num_freqs,
-                            random_state = random_seed)
+        self.chi_arr = sample_chi(rng, padded_dims, self.num_freqs)
         if not self.double_precision:
             self.chi_arr = self.chi_arr.astype(np.float32)
 
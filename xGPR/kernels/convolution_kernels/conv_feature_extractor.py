@@ -5,7 +5,6 @@ resulting in a two-layer GP. Consequently, these can also be considered
 from math import ceil
 
 import numpy as np
-from scipy.stats import chi
 
 from xGPR.xgpr_cpu_rfgen_cpp_ext import cpuConv1dMaxpool
 try:
@@ -14,6 +13,7 @@ try:
 except:
     pass
 
+from ..kernel_baseclass import sample_chi
 
 
 class FHTMaxpoolConv1dFeatureExtractor():
@@ -69,8 +69,8 @@ class FHTMaxpoolConv1dFeatureExtractor():
 
         self.radem_diag = rng.choice(radem_array, size=(3, 1, init_calc_featsize),
                                 replace=True)
-        self.chi_arr = chi.rvs(df=padded_dims, size=self.num_rffs,
-                            random_state = random_seed).astype(np.float32)
+        self.chi_arr = sample_chi(rng, padded_dims,
+                            self.num_rffs).astype(np.float32)
 
         self.num_threads = num_threads
         self.device = device
@@ -5,7 +5,6 @@ from abc import ABC
 from math import ceil
 
 import numpy as np
-from scipy.stats import chi
 
 from xGPR.xgpr_cpu_rfgen_cpp_ext import cpuConv1dFGen, cpuConvGrad
 try:
@@ -14,7 +13,7 @@ try:
 except:
     pass
 
-from ..kernel_baseclass import KernelBaseclass
+from ..kernel_baseclass import KernelBaseclass, sample_chi
 
 
 
@@ -95,8 +94,7 @@ class ConvKernelBaseclass(KernelBaseclass, ABC):
         radem_array = np.asarray([-1,1], dtype=np.int8)
         self.radem_diag = rng.choice(radem_array, size=(3, 1, init_calc_freqsize),
                                 replace=True)
-        self.chi_arr = chi.rvs(df=padded_dims, size=self.num_freqs,
-                            random_state = random_seed)
+        self.chi_arr = sample_chi(rng, padded_dims, self.num_freqs)
         if not self.double_precision:
             self.chi_arr = self.chi_arr.astype(np.float32)
 
@@ -135,17 +133,18 @@ class ConvKernelBaseclass(KernelBaseclass, ABC):
         if input_x.shape[2] != self._xdim[2]:
             raise RuntimeError("Unexpected input shape supplied.")
 
-        input_x *= self.hyperparams[1]
-
+        # The extension multiplies the input by sigma as it reads it,
+        # so we do not rescale input_x here.
         if self.device == "cpu":
             xtrans = np.zeros((input_x.shape[0], self.num_rffs), np.float64)
             cpuConv1dFGen(input_x, xtrans, self.radem_diag, self.chi_arr,
-                    sequence_length, self.conv_width, self.scaling_type,
-                    self.num_threads)
+                    sequence_length, self.hyperparams[1], self.conv_width,
+                    self.scaling_type, self.num_threads)
         else:
             xtrans = cp.zeros((input_x.shape[0], self.num_rffs), cp.float64)
             cudaConv1dFGen(input_x, xtrans, self.radem_diag, self.chi_arr,
-                    sequence_length, self.conv_width, self.scaling_type)
+                    sequence_length, self.hyperparams[1], self.conv_width,
+                    self.scaling_type)
 
         return xtrans
 
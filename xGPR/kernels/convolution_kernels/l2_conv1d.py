@@ -4,7 +4,6 @@ into an RBF kernel, analogous to a 3-layer CNN."""
 from math import ceil
 
 import numpy as np
-from scipy.stats import chi
 
 from xGPR.xgpr_cpu_rfgen_cpp_ext import cpuConv1dMaxpool
 from xGPR.xgpr_cpu_rfgen_cpp_ext import cpuRBFFeatureGen, cpuRBFGrad
@@ -15,7 +14,7 @@ try:
 except:
     pass
 
-from ..kernel_baseclass import KernelBaseclass
+from ..kernel_baseclass import KernelBaseclass, sample_chi
 
 
 
@@ -115,8 +114,7 @@ class Conv1dTwoLayer(KernelBaseclass):
 
         self.radem_diag1 = rng.choice(radem_array, size=(3, 1, init_calc_featsize),
                                 replace=True)
-        self.chi_arr1 = chi.rvs(df=padded_dims, size=self.init_rffs,
-                            random_state = random_seed)
+        self.chi_arr1 = sample_chi(rng, padded_dims, self.init_rffs)
 
 
         # Next, set up the information needed for the RBF output layer.
@@ -128,8 +126,7 @@ class Conv1dTwoLayer(KernelBaseclass):
             nblocks = 1
         self.radem_diag2 = rng.choice(radem_array, size=(3, 1,
                 nblocks * padded_dims), replace=True)
-        self.chi_arr2 = chi.rvs(df=padded_dims, size=self.num_freqs,
-                            random_state = random_seed)
+        self.chi_arr2 = sample_chi(rng, padded_dims, self.num_freqs)
         if not self.double_precision:
             self.chi_arr1 = self.chi_arr1.astype(np.float32)
             self.chi_arr2 = self.chi_arr2.astype(np.float32)
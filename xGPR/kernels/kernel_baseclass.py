@@ -15,6 +15,22 @@ except:
     pass
 
 
+def sample_chi(rng, df, size):
+    """Draws samples from a chi distribution with df degrees of freedom.
+    A chi variable with df degrees of freedom is the square root of
+    2 * Gamma(df / 2), so this can be done using numpy alone.
+
+    Args:
+        rng: A numpy Generator.
+        df (int): The degrees of freedom.
+        size (int): The number of samples to draw.
+
+    Returns:
+        samples (np.ndarray): A float64 array of shape (size).
+    """
+    return np.sqrt(2.0 * rng.standard_gamma(df / 2.0, size=size))
+
+
 class KernelBaseclass(ABC):
     """The baseclass for all other kernel classes.
 
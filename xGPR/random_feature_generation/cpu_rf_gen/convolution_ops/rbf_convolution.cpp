@@ -30,6 +30,8 @@
  * + `chiArr` The (F) shape numpy diagonal matrix by which the results are scaled.
  * + `seqlengths` An (N) shape numpy array of sequence lengths (to exclude zero
  * padding).
+ * + `sigma` The sigma hyperparameter. The input is multiplied by this
+ * as it is copied, so the caller does not need to rescale it.
  * + `convWidth` The width of the convolution kernel.
  * + `scalingType` One of 0, 1 or 2; indicates the type of scaling. These
  * are defined in the header.
@@ -41,7 +43,7 @@ int convRBFFeatureGen_(nb::ndarray<T, nb::shape<-1,-1,-1>, nb::device::cpu, nb::
         nb::ndarray<int8_t, nb::shape<3,1,-1>, nb::device::cpu, nb::c_contig> radem,
         nb::ndarray<T, nb::shape<-1>, nb::device::cpu, nb::c_contig> chiArr,
         nb::ndarray<int32_t, nb::shape<-1>, nb::device::cpu, nb::c_contig> seqlengths,
-        int convWidth, int scalingType, int numThreads) {
+        double sigma, int convWidth, int scalingType, int numThreads) {
 
     // Perform safety checks. Any exceptions thrown here are handed off to Python
     // by the Nanobind wrapper. We do not expect the user to see these because
@@ -112,7 +114,7 @@ int convRBFFeatureGen_(nb::ndarray<T, nb::shape<-1,-1,-1>, nb::device::cpu, nb::
                 rademPtr, chiPtr, outputPtr,
                 seqlengthsPtr, inputArr.shape(1), inputArr.shape(2),
                 numFreqs, radem.shape(2), startRow, endRow, convWidth,
-                paddedBufferSize, scalingTerm, scalingType);
+                paddedBufferSize, scalingTerm, scalingType, sigma);
     }
 
     for (auto& th : threads)
@@ -126,13 +128,13 @@ template int convRBFFeatureGen_<double>(nb::ndarray<double, nb::shape<-1,-1,-1>,
         nb::ndarray<int8_t, nb::shape<3, 1, -1>, nb::device::cpu, nb::c_contig> radem,
         nb::ndarray<double, nb::shape<-1>, nb::device::cpu, nb::c_contig> chiArr,
         nb::ndarray<int32_t, nb::shape<-1>, nb::device::cpu, nb::c_contig> seqlengths,
-        int convWidth, int scalingType, int numThreads);
+        double sigma, int convWidth, int scalingType, int numThreads);
 template int convRBFFeatureGen_<float>(nb::ndarray<float, nb::shape<-1,-1,-1>, nb::device::cpu, nb::c_contig> inputArr,
         nb::ndarray<double, nb::shape<-1,-1>, nb::device::cpu, nb::c_contig> outputArr,
         nb::ndarray<int8_t, nb::shape<3, 1, -1>, nb::device::cpu, nb::c_contig> radem,
         nb::ndarray<float, nb::shape<-1>, nb::device::cpu, nb::c_contig> chiArr,
         nb::ndarray<int32_t, nb::shape<-1>, nb::device::cpu, nb::c_contig> seqlengths,
-        int convWidth, int scalingType, int numThreads);
+        double sigma, int convWidth, int scalingType, int numThreads);
 
 
 
@@ -283,7 +285,7 @@ void *allInOneConvRBFGen(T xdata[], int8_t *rademArray, T chiArr[],
         double *outputArray, int32_t *seqlengths, int dim1, int dim2,
         int numFreqs, int rademShape2, int startRow, int endRow,
         int convWidth, int paddedBufferSize,
-        double scalingTerm, int scalingType) {
+        double scalingTerm, int scalingType, T sigma) {
 
     int numKmers;
     int32_t seqlength;
@@ -316,7 +318,7 @@ void *allInOneConvRBFGen(T xdata[], int8_t *rademArray, T chiArr[],
 
             for (int k=0; k < numRepeats; k++) {
                 for (int m=0; m < (convWidth * dim2); m++)
-                    copyBuffer[m] = xElement[m];
+                    copyBuffer[m] = xElement[m] * sigma;
                 for (int m=(convWidth * dim2); m < paddedBufferSize; m++)
                     copyBuffer[m] = 0;
 
@@ -22,7 +22,7 @@ int convRBFFeatureGen_(nb::ndarray<T, nb::shape<-1,-1,-1>, nb::device::cpu, nb::
         nb::ndarray<int8_t, nb::shape<3, 1, -1>, nb::device::cpu, nb::c_contig> radem,
         nb::ndarray<T, nb::shape<-1>, nb::device::cpu, nb::c_contig> chiArr,
         nb::ndarray<int32_t, nb::shape<-1>, nb::device::cpu, nb::c_contig> seqlengths,
-        int convWidth, int scalingType, int numThreads);
+        double sigma, int convWidth, int scalingType, int numThreads);
 
 template <typename T>
 int convRBFGrad_(nb::ndarray<T, nb::shape<-1,-1,-1>, nb::device::cpu, nb::c_contig> inputArr,
@@ -38,7 +38,7 @@ void *allInOneConvRBFGen(T xdata[], int8_t *rademArray, T chiArr[],
         double *outputArray, int32_t *seqlengths, int dim1, int dim2,
         int numFreqs, int rademShape2, int startRow, int endRow,
         int convWidth, int paddedBufferSize,
-        double scalingTerm, int scalingType);
+        double scalingTerm, int scalingType, T sigma);
 
 template <typename T>
 void *allInOneConvRBFGrad(T xdata[], int8_t *rademArray, T chiArr[],
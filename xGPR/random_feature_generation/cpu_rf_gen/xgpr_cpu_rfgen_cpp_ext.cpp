@@ -70,12 +70,12 @@ NB_MODULE(xgpr_cpu_rfgen_cpp_ext, m){
     m.def("cpuConv1dFGen", &convRBFFeatureGen_<float>, nb::arg("inputArr").noconvert(),
             nb::arg("outputArr").noconvert(), nb::arg("radem").noconvert(),
             nb::arg("chiArr").noconvert(), nb::arg("seqlengths").noconvert(),
-            nb::arg("convWidth"), nb::arg("scalingType"),
+            nb::arg("sigma"), nb::arg("convWidth"), nb::arg("scalingType"),
             nb::arg("numThreads"));
     m.def("cpuConv1dFGen", &convRBFFeatureGen_<double>, nb::arg("inputArr").noconvert(),
             nb::arg("outputArr").noconvert(), nb::arg("radem").noconvert(),
             nb::arg("chiArr").noconvert(), nb::arg("seqlengths").noconvert(),
-            nb::arg("convWidth"), nb::arg("scalingType"),
+            nb::arg("sigma"), nb::arg("convWidth"), nb::arg("scalingType"),
             nb::arg("numThreads"));
 
     m.def("cpuConvGrad", &convRBFGrad_<float>, nb::arg("inputArr").noconvert(),
@@ -20,7 +20,7 @@ __global__ void convRBFFeatureGenKernel(const T origData[], T cArray[],
         int paddedBufferSize, int log2N, int numFreqs, int xDim1, int xDim2,
         int nRepeats, int rademShape2, T normConstant,
         double scalingConstant, int scalingType,
-        int convWidth, const int32_t *seqlengths){
+        int convWidth, const int32_t *seqlengths, T sigma){
 
     int stepSize = MIN(paddedBufferSize, MAX_BASE_LEVEL_TRANSFORM);
     int colCutoff = seqlengths[blockIdx.x] - convWidth + 1;
@@ -61,7 +61,7 @@ __global__ void convRBFFeatureGenKernel(const T origData[], T cArray[],
             //Copy original data into the temporary array.
             for (int i = threadIdx.x; i < paddedBufferSize; i += blockDim.x){
                 if (i < inputCutoff)
-                    cArray[i + tempArrPos] = origData[i + inputArrPos];
+                    cArray[i + tempArrPos] = origData[i + inputArrPos] * sigma;
                 else
                     cArray[i + tempArrPos] = 0;
             }
@@ -311,7 +311,7 @@ int convRBFFeatureGen(nb::ndarray<T, nb::shape<-1,-1,-1>, nb::device::cuda, nb::
         nb::ndarray<int8_t, nb::shape<3, 1, -1>, nb::device::cuda, nb::c_contig> radem,
         nb::ndarray<T, nb::shape<-1>, nb::device::cuda, nb::c_contig> chiArr,
         nb::ndarray<int32_t, nb::shape<-1>, nb::device::cpu, nb::c_contig> seqlengths,
-        int convWidth, int scalingType) {
+        double sigma, int convWidth, int scalingType) {
 
     // Perform safety checks. Any exceptions thrown here are handed off to Python
     // by the Nanobind wrapper. We do not expect the user to see these because
@@ -397,7 +397,7 @@ int convRBFFeatureGen(nb::ndarray<T, nb::shape<-1,-1,-1>, nb::device::cuda, nb::
     convRBFFeatureGenKernel<T><<<zDim0, stepSize / 2, stepSize * sizeof(T)>>>(inputPtr,
             featureArray, outputPtr, chiPtr, rademPtr, paddedBufferSize, log2N, numFreqs, zDim1, zDim2,
             numRepeats, radem.shape(2), normConstant, scalingTerm, scalingType, convWidth,
-            slenCudaPtr);
+            slenCudaPtr, sigma);
 
     cudaFree(slenCudaPtr);
     cudaFree(featureArray);
@@ -409,13 +409,13 @@ template int convRBFFeatureGen<double>(nb::ndarray<double, nb::shape<-1,-1,-1>,
         nb::ndarray<int8_t, nb::shape<3, 1, -1>, nb::device::cuda, nb::c_contig> radem,
         nb::ndarray<double, nb::shape<-1>, nb::device::cuda, nb::c_contig> chiArr,
         nb::ndarray<int32_t, nb::shape<-1>, nb::device::cpu, nb::c_contig> seqlengths,
-        int convWidth, int scalingType);
+        double sigma, int convWidth, int scalingType);
 template int convRBFFeatureGen<float>(nb::ndarray<float, nb::shape<-1,-1,-1>, nb::device::cuda, nb::c_contig> inputArr,
         nb::ndarray<double, nb::shape<-1,-1>, nb::device::cuda, nb::c_contig> outputArr,
         nb::ndarray<int8_t, nb::shape<3, 1, -1>, nb::device::cuda, nb::c_contig> radem,
         nb::ndarray<float, nb::shape<-1>, nb::device::cuda, nb::c_contig> chiArr,
         nb::ndarray<int32_t, nb::shape<-1>, nb::device::cpu, nb::c_contig> seqlengths,
-        int convWidth, int scalingType);
+        double sigma, int convWidth, int scalingType);
 
 
 
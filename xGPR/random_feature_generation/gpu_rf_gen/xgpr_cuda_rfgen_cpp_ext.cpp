@@ -66,13 +66,13 @@ NB_MODULE(xgpr_cuda_rfgen_cpp_ext, m){
     m.def("cudaConv1dFGen", &convRBFFeatureGen<float>,
             nb::arg("inputArr").noconvert(), nb::arg("outputArr").noconvert(),
             nb::arg("radem").noconvert(), nb::arg("chiArr").noconvert(),
-            nb::arg("seqlengths").noconvert(), nb::arg("convWidth"),
-            nb::arg("scalingType"));
+            nb::arg("seqlengths").noconvert(), nb::arg("sigma"),
+            nb::arg("convWidth"), nb::arg("scalingType"));
     m.def("cudaConv1dFGen", &convRBFFeatureGen<double>,
             nb::arg("inputArr").noconvert(), nb::arg("outputArr").noconvert(),
             nb::arg("radem").noconvert(), nb::arg("chiArr").noconvert(),
-            nb::arg("seqlengths").noconvert(), nb::arg("convWidth"),
-            nb::arg("scalingType"));
+            nb::arg("seqlengths").noconvert(), nb::arg("sigma"),
+            nb::arg("convWidth"), nb::arg("scalingType"));
 
     m.def("cudaConvGrad", &convRBFFeatureGrad<float>,
             nb::arg("inputArr").noconvert(), nb::arg("outputArr").noconvert(),
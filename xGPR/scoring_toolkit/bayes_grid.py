@@ -4,8 +4,6 @@ with Bayesian optimization to find good hyperparameters."""
 import warnings
 
 import numpy as np
-from sklearn.gaussian_process import GaussianProcessRegressor as GPR
-from sklearn.gaussian_process.kernels import RBF, Matern
 
 from .lb_optimizer import shared_hparam_search
 
@@ -44,6 +42,10 @@ def bayes_grid_tuning(kernel, dataset, bounds, random_seed,
         ValueError: A ValueError is raised if this is run with a kernel with >
             5 or <= 2 hyperparameters.
     """
+    # sklearn (and through it scipy.stats) is imported here rather than
+    # at module level so that importing xGPR does not pull it in.
+    from sklearn.gaussian_process import GaussianProcessRegressor as GPR
+    from sklearn.gaussian_process.kernels import RBF, Matern
 
     if bounds.shape[0] >= 4 or bounds.shape[0] < 2:
         raise ValueError("Bayesian optimization is only allowed for kernels with "
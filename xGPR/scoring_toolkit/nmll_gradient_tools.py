@@ -115,21 +115,23 @@ def exact_nmll_reg_grad(z_trans_z, z_trans_y, y_trans_y,
         grad (np.ndarray): A numpy array containing the gradient of the
             hyperparameters.
     """
-    z_trans_z.flat[::z_trans_z.shape[0]+1] += hparams[0]**2
-
     if device == "cuda":
+        diag_idx = cp.arange(z_trans_z.shape[0])
+        z_trans_z[diag_idx, diag_idx] += hparams[0]**2
         weights, z_trans_z_chol, chol_inv = gpu_cho_calcs(z_trans_z,
                     z_trans_y, hparams[0])
-        cho_solver = gpu_cho_solver
-        nll1 = float(0.5 * (y_trans_y - z_trans_y.T @ weights))
+        einsum, to_host = cp.einsum, cp.asnumpy
         nll2 = float(cp.log(cp.diag(z_trans_z_chol)).sum())
     else:
+        diag_idx = np.arange(z_trans_z.shape[0])
+        z_trans_z[diag_idx, diag_idx] += hparams[0]**2
         weights, z_trans_z_chol, chol_inv = cpu_cho_calcs(z_trans_z,
                     z_trans_y, hparams[0])
-        cho_solver = cpu_cho_solver
-        nll1 = float(0.5 * (y_trans_y - z_trans_y.T @ weights))
+        einsum, to_host = np.einsum, np.asarray
         nll2 = float(np.log(np.diag(z_trans_z_chol)).sum())
 
+    z_trans_y_weights = z_trans_y.T @ weights
+    nll1 = float(0.5 * (y_trans_y - z_trans_y_weights))
     nrffs = float(z_trans_z.shape[0])
     negloglik, beta = optimize_alpha_beta(hparams[0],
                 np.array([nll1, nll2]), float(ndatapoints), nrffs)
@@ -141,35 +143,32 @@ def exact_nmll_reg_grad(z_trans_z, z_trans_y, y_trans_y,
     alpha = hparams[0] * beta
 
     #First calculate gradient w/r/t lambda...
-    dnll_dlambda = (1 / (beta**2 * hparams[0]**3)) * ((z_trans_y.T @ weights) - y_trans_y)
+    dnll_dlambda = (1 / (beta**2 * hparams[0]**3)) * (z_trans_y_weights - y_trans_y)
     dnll_dlambda += (1 / (beta**2 * hparams[0])) * (weights.T @ weights)
     dnll_dlambda += (ndatapoints - z_trans_z_chol.shape[1]) / hparams[0]
-    dnll_dlambda += hparams[0] * (chol_inv**2).sum()
+    dnll_dlambda += hparams[0] * einsum("ij,ij->", chol_inv, chol_inv)
     grad[0] = float(dnll_dlambda)
 
-    #Finally, calculate kernel-specific hyperparameter gradients.
-
-    for i in range(grad.shape[0] - 1):
-        trace_term = cho_solver(z_trans_z_chol, inner_deriv[:,:,i])
-        dnll_dsigma = -2 * (weights.T @ dz_dsigma_ty[:,i])
-        dnll_dsigma += (weights.T @ (inner_deriv[:,:,i] @ weights))
+    #Finally, calculate kernel-specific hyperparameter gradients. Since
+    #chol_inv is the inverse of the Cholesky factor, chol_inv^T chol_inv
+    #is the inverse of z^T z + lambda**2, and the trace term for each
+    #hyperparameter is then an elementwise contraction with inner_deriv.
+    if grad.shape[0] > 1:
+        z_trans_z_inv = chol_inv.T @ chol_inv
+        trace_terms = einsum("ijk,ji->k", inner_deriv, z_trans_z_inv)
+        dnll_dsigma = -2 * (weights @ dz_dsigma_ty)
+        dnll_dsigma += einsum("i,ijk,j->k", weights, inner_deriv, weights)
         dnll_dsigma *= (0.5 / alpha**2)
-        dnll_dsigma += 0.5 * trace_term.trace()
-        grad[i+1] = float(dnll_dsigma)
+        dnll_dsigma += 0.5 * trace_terms
+        grad[1:] = to_host(dnll_dsigma)
 
     grad *= hparams
     return negloglik, grad, beta
 
 
-def cpu_cho_solver(chol_decomp, target):
-    """Provides a cho_solver calc for cpu (so that
-    both the cpu and gpu call share a common interface)."""
-    return cho_solve((chol_decomp, True), target)
-
 def gpu_cho_solver(chol_decomp, target):
-    """Provides a cho_solver calc for gpu (so that
-    both the cpu and gpu call share a common interface).
-    TODO: Optimize."""
+    """Provides a cho_solver calc for gpu, using two
+    triangular solves. TODO: Optimize."""
     sol = cpx.scipy.linalg.solve_triangular(chol_decomp,
                             target, lower=True)
     return cpx.scipy.linalg.solve_triangular(chol_decomp.T,
@@ -200,7 +199,8 @@ def gpu_cho_calcs(z_trans_z, z_trans_y, lambda_):
     """
     z_trans_z_chol = cp.linalg.cholesky(z_trans_z)
     weights = gpu_cho_solver(z_trans_z_chol, z_trans_y)
-    z_trans_z.flat[::z_trans_z.shape[0]+1] -= lambda_**2
+    diag_idx = cp.arange(z_trans_z.shape[0])
+    z_trans_z[diag_idx, diag_idx] -= lambda_**2
     chol_inv = cpx.scipy.linalg.solve_triangular(z_trans_z_chol,
                     cp.eye(z_trans_z_chol.shape[0]), lower=True)
     return weights, z_trans_z_chol, chol_inv
@@ -230,7 +230,8 @@ def cpu_cho_calcs(z_trans_z, z_trans_y, lambda_):
     """
     z_trans_z_chol = np.linalg.cholesky(z_trans_z)
     weights = cho_solve((z_trans_z_chol, True), z_trans_y)
-    z_trans_z.flat[::z_trans_z.shape[0]+1] -= lambda_**2
+    diag_idx = np.arange(z_trans_z.shape[0])
+    z_trans_z[diag_idx, diag_idx] -= lambda_**2
     chol_inv = solve_triangular(z_trans_z_chol,
                     np.eye(z_trans_z_chol.shape[0]), lower=True)
     return weights, z_trans_z_chol, chol_inv